@@ -94,6 +94,10 @@ accepted = levels + [list(i) for i in product(levels, modes)]
 configuration.add('autotuning', 'off', accepted, callback=autotune_callback,
                   impacts_jit=False)
 
+# Should the autotuning outcomes be cached on disk, so that warm runs of the same
+# Operator, over the same iteration space, can skip autotuning altogether?
+configuration.add('autotuning-cache', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
 # In develop-mode:
 # - Some optimizations may not be applied to the generated code.
 # - The compiler performs more type and value checking
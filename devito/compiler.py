@@ -1,6 +1,6 @@
 from functools import partial
 from hashlib import sha1
-from os import environ, path
+from os import devnull, environ, path
 from distutils import version
 from subprocess import DEVNULL, PIPE, CalledProcessError, check_output, check_call, run
 import platform
@@ -17,11 +17,15 @@ from devito.exceptions import CompilationError
 from devito.logger import debug, warning, error
 from devito.parameters import configuration
 from devito.tools import (as_tuple, change_directory, filter_ordered,
-                          memoized_meth, make_tempdir)
+                          memoized_func, memoized_meth, make_tempdir)
 
 __all__ = ['GNUCompiler']
 
 
+# The sonames jit-compiled, or fetched from the jit-cache, within this process
+_jit_compiled = set()
+
+
 def sniff_compiler_version(cc):
     """
     Detect the compiler version.
@@ -80,6 +84,20 @@ def sniff_compiler_version(cc):
     return ver
 
 
+@memoized_func
+def sniff_float16_support(cc):
+    """
+    Detect whether the compiler ``cc`` supports the ``_Float16`` type, which is
+    the case from GCC 12 and Clang 15 onwards.
+    """
+    try:
+        res = run([cc, '-x', 'c', '-c', '-o', devnull, '-'], input=b'_Float16 a;',
+                  stdout=DEVNULL, stderr=DEVNULL)
+    except OSError:
+        return False
+    return res.returncode == 0
+
+
 def sniff_mpi_distro(mpiexec):
     """
     Detect the MPI version.
@@ -190,6 +208,11 @@ class Compiler(GCCToolchain):
                               mpi=kwargs.pop('mpi', configuration['mpi']),
                               **kwargs)
 
+    @property
+    def supports_float16(self):
+        """True if the half precision type ``_Float16`` is supported, False otherwise."""
+        return sniff_float16_support(self.cc)
+
     @memoized_meth
     def get_jit_dir(self):
         """A deterministic temporary directory for jit-compiled objects."""
@@ -267,7 +290,10 @@ class Compiler(GCCToolchain):
 
         This function relies upon codepy's ``compile_from_string``, which performs
         caching of compilation units and avoids potential race conditions due to
-        multiple processing trying to compile the same object.
+        multiple processing trying to compile the same object. Within a process,
+        a shared object that has already been compiled (or fetched from the
+        codepy cache) is never looked up again, thus skipping codepy's locking
+        and checksumming altogether.
 
         Parameters
         ----------
@@ -279,6 +305,9 @@ class Compiler(GCCToolchain):
         target = str(self.get_jit_dir().joinpath(soname))
         src_file = "%s.%s" % (target, self.src_ext)
 
+        if configuration['jit-backdoor'] is False and soname in _jit_compiled:
+            return False, src_file
+
         cache_dir = self.get_codepy_dir().joinpath(soname[:7])
         if configuration['jit-backdoor'] is False:
             # Typically we end up here
@@ -317,6 +346,9 @@ class Compiler(GCCToolchain):
                                                       cache_dir=cache_dir, debug=debug,
                                                       sleep_delay=sleep_delay)
 
+        if configuration['jit-backdoor'] is False:
+            _jit_compiled.add(soname)
+
         return recompiled, src_file
 
     def __lookup_cmds__(self):
@@ -331,6 +363,13 @@ class Compiler(GCCToolchain):
     def __repr__(self):
         return "JITCompiler[%s]" % self.__class__.__name__
 
+    def _signature_items(self):
+        # Anything affecting the generated binary, so that two Operators with
+        # identical code but compiled with different flags get distinct sonames
+        items = [self.cc] + self.cflags + self.ldflags + self.include_dirs
+        items += self.libraries + self.library_dirs + self.defines + self.undefines
+        return tuple(str(i) for i in items)
+
     def __getstate__(self):
         # The superclass would otherwise only return a subset of attributes
         return self.__dict__
@@ -1,8 +1,11 @@
 from collections import OrderedDict
-from itertools import combinations, product
 from functools import total_ordering
+import json
+import os
 import resource
 
+import numpy as np
+
 from devito.archinfo import KNL, KNL7210
 from devito.ir import Backward, retrieve_iteration_tree
 from devito.logger import perf, warning as _warning
@@ -39,6 +42,16 @@ def autotune(operator, args, level, mode):
         raise ValueError("The accepted `(level, mode)` combinations are `%s`; "
                          "provided `%s` instead" % (accepted, key))
 
+    # Reuse the outcome of a previous autotuning session, if any
+    if configuration['autotuning-cache']:
+        cache_key = make_cache_key(operator, args, level)
+        best = cache_load(operator, cache_key)
+        if best is not None:
+            log("fetched <%s> from cache" %
+                (','.join('%s=%s' % i for i in best.items())))
+            args.update(best)
+            return args, {'runs': 0, 'tpr': 0, 'tuned': dict(best)}
+
     # We get passed all the arguments, but the cfunction only requires a subset
     at_args = OrderedDict([(p.name, args[p.name]) for p in operator.parameters])
 
@@ -65,6 +78,11 @@ def autotune(operator, args, level, mode):
                     i.fromrank = MPI.PROC_NULL
                     i.torank = MPI.PROC_NULL
 
+    # The runs are timed through the C-level profiling timers
+    if not operator._profiler.timer.sections:
+        warning("cannot perform autotuning unless profiling is enabled; skipping")
+        return args, {}
+
     roots = [operator.body] + [i.root for i in operator._func_table.values()]
     trees = filter_ordered(retrieve_iteration_tree(roots), key=lambda i: i.root)
 
@@ -85,18 +103,18 @@ def autotune(operator, args, level, mode):
 
     # Perform autotuning
     timings = {}
+    completed = True
     for n, tree in enumerate(trees):
         blockable = [i.dim for i in tree if not is_integer(i.step)]
 
         # Tunable arguments
         try:
-            tunable = []
-            tunable.append(generate_block_shapes(blockable, args, level))
-            tunable.append(generate_nthreads(operator.nthreads, args, level))
-            tunable = list(product(*tunable))
+            block_shapes, block_space = generate_block_shapes(blockable, args, level)
+            nthreads = generate_nthreads(operator.nthreads, args, level)
         except ValueError:
             # Some arguments are compulsory, otherwise autotuning is skipped
             continue
+        tunable = generate_tunables(block_shapes, block_space, nthreads, timings, n)
 
         # Symbolic number of loop-blocking blocks per thread
         nblocks_per_thread = calculate_nblocks(tree, blockable) / operator.nthreads
@@ -104,6 +122,7 @@ def autotune(operator, args, level, mode):
         for bs, nt in tunable:
             # Can we safely autotune over the given time range?
             if not check_time_bounds(stepper, at_args, args, mode):
+                completed = False
                 break
 
             # Update `at_args` to use the new tunable arguments
@@ -111,19 +130,18 @@ def autotune(operator, args, level, mode):
             at_args.update(dict(run))
 
             # Drop run if not at least one block per thread
-            if not configuration['develop-mode'] and nblocks_per_thread.subs(at_args) < 1:
+            if not configuration['develop-mode'] and \
+                    evaluate(nblocks_per_thread, at_args) < 1:
                 continue
 
             # Make sure we remain within stack bounds, otherwise skip run
             try:
-                stack_footprint = operator._mem_summary['stack']
-                if int(stack_footprint.subs(at_args)) > options['stack_limit']:
+                stack_footprint = evaluate(operator._mem_summary['stack'], at_args)
+                if int(stack_footprint) > options['stack_limit']:
                     continue
             except TypeError:
-                warning("could not determine stack size; skipping run %s" % str(i))
+                warning("could not determine stack size; skipping run %s" % str(run))
                 continue
-            except AttributeError:
-                assert stack_footprint == 0
 
             # Run the Operator
             operator.cfunction(*list(at_args.values()))
@@ -160,6 +178,10 @@ def autotune(operator, args, level, mode):
     # Update the argument list with the tuned arguments
     args.update(best)
 
+    # Only the outcome of a complete search is worth caching
+    if configuration['autotuning-cache'] and completed:
+        cache_save(operator, cache_key, best)
+
     # In `runtime` mode, some timesteps have been executed already, so we must
     # adjust the time range
     finalize_time_bounds(stepper, at_args, args, mode)
@@ -257,6 +279,81 @@ def finalize_time_bounds(stepper, at_args, args, mode):
         args[dim.max_name] = args[dim.max_name]
 
 
+def evaluate(expr, at_args):
+    """
+    Evaluate the symbolic expression ``expr`` given the runtime values in
+    ``at_args``. Unlike ``expr.subs(at_args)``, only the free symbols of ``expr``
+    are looked up, and no sympification of the (many) runtime values takes place.
+    This matters as it is performed for each and every autotuning run.
+    """
+    try:
+        mapper = {i: at_args[i.name] for i in expr.free_symbols if i.name in at_args}
+    except AttributeError:
+        # E.g., a plain Python number
+        return expr
+    return expr.xreplace(mapper)
+
+
+def make_cache_key(operator, args, level):
+    """
+    The key under which the outcome of autotuning ``operator`` is cached. The
+    generated code is already accounted for by the cache file name (see
+    ``cache_file``), so the key only captures the runtime setup: the autotuning
+    level, the extent of the iteration space, and the number of threads.
+    """
+    dims = sorted([d for d in operator.dimensions if d.is_Space and not d.is_Derived],
+                  key=lambda d: d.name)
+    shape = tuple(int(args[d.max_name]) - int(args[d.min_name]) + 1 for d in dims
+                  if d.min_name in args and d.max_name in args)
+    nthreads = operator.nthreads
+    if nthreads != 1:
+        nthreads = args[nthreads.name]
+    return str((level, shape, int(nthreads)))
+
+
+def cache_file(operator):
+    """
+    The JSON file caching the autotuning outcomes of ``operator``. It is named
+    after the shared object, so it is naturally invalidated whenever the
+    generated code changes.
+    """
+    return operator._compiler.get_jit_dir().joinpath('at-%s.json' % operator._soname)
+
+
+def cache_load(operator, key):
+    try:
+        with open(cache_file(operator), 'r') as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        warning("could not read the autotuning cache; ignoring it")
+        return None
+    try:
+        return OrderedDict(cached[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def cache_save(operator, key, best):
+    filename = cache_file(operator)
+    try:
+        with open(filename, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+    cached[key] = [(k, int(v)) for k, v in best.items()]
+    # Write to a temporary file first, so that concurrent processes (e.g., MPI
+    # ranks) never observe a partially written cache
+    tmpfile = filename.with_suffix('.%d.tmp' % os.getpid())
+    try:
+        with open(tmpfile, 'w') as f:
+            json.dump(cached, f)
+        os.replace(tmpfile, filename)
+    except OSError:
+        warning("could not write the autotuning cache")
+
+
 def calculate_nblocks(tree, blockable):
     collapsed = tree[:(tree[0].ncollapsed or 1)]
     blocked = [i.dim for i in collapsed if i.dim in blockable]
@@ -291,18 +388,6 @@ def generate_block_shapes(blockable, args, level):
             new_bs = tuple((b, v*2) for b, v in handle)
             ret.insert(ret.index(handle) + 1, new_bs)
             handle = new_bs
-        handle = []
-        # Extended shuffling for the smaller block shapes
-        for bs in ret[:4]:
-            for i in ret:
-                handle.append(bs[:-1] + (i[-1],))
-        # Some more shuffling for all block shapes
-        for bs in list(ret):
-            ncombs = len(bs)
-            for i in range(ncombs):
-                for j in combinations(dict(bs), i+1):
-                    handle.append(tuple((b, v*2 if b in j else v) for b, v in bs))
-        ret.extend(handle)
     # Drop block shapes exceeding the iteration space extent
     ret = [i for i in ret if all(dict(i)[k] <= v for k, v in max_bs)]
     # Drop redundant block shapes
@@ -326,10 +411,70 @@ def generate_block_shapes(blockable, args, level):
     # TODO -- currently, there's no Operator producing depth>2 hierarchical blocking,
     # so for simplicity we ignore this for the time being
 
+    # Generate the search space for coordinate descent (aggressive mode only),
+    # that is all legal combinations of the values attempted along each Dimension
+    space = []
+    if level in ['aggressive', 'max'] and ret:
+        keys = [k for k, _ in ret[0]]
+        values = [sorted(set(int(bs[i][1]) for bs in ret)) for i in range(len(keys))]
+        # The candidates are screened as rows of an integer mesh, so that only
+        # the legal ones are eventually turned into block shapes
+        mesh = np.stack(np.meshgrid(*values, indexing='ij'), axis=-1)
+        mesh = mesh.reshape(-1, len(keys))
+        if level_1:
+            # Sub-blocks must be smaller than and divide evenly their parent block
+            l0, l1 = mesh[:, :len(level_0)], mesh[:, len(level_0):]
+            mesh = mesh[((l1 <= l0) & (l0 % l1 == 0)).all(axis=1)]
+        space = [tuple(zip(keys, map(int, i))) for i in mesh]
+
     # Normalize
     ret = [tuple((k.name, v) for k, v in bs) for bs in ret]
+    space = [tuple((k.name, v) for k, v in bs) for bs in space]
 
-    return ret
+    return ret, space
+
+
+def generate_tunables(block_shapes, block_space, nthreads, timings, n):
+    """
+    Generate the ``(block shape, nthreads)`` pairs to be attempted for the
+    ``n``-th Iteration nest.
+
+    For each ``nthreads``, all ``block_shapes`` are attempted first. Then, if
+    a non-empty ``block_space`` is provided, the fastest block shape is refined
+    through coordinate descent: one Dimension at a time, the block shapes in
+    ``block_space`` differing from the current best only along that Dimension
+    are attempted, and the fastest one is retained. This only requires
+    ``O(d*|B|)`` runs per pass, rather than ``O(|B|^d)``, where ``d`` is the
+    number of blocked Dimensions and ``|B|`` the number of block sizes.
+
+    The timings of the runs performed so far are read from ``timings``, which
+    is expected to be updated by the caller as the runs are performed.
+    """
+    for nt in nthreads:
+        attempted = set()
+        for bs in block_shapes:
+            attempted.add(bs)
+            yield bs, nt
+
+        for _ in range(options['descent-passes']):
+            runs = timings.get(nt, {}).get(n)
+            if not runs:
+                # No successful runs, hence no starting point
+                break
+            start = best = min(runs, key=runs.get)
+            for i in range(len(best)):
+                for bs in block_space:
+                    if bs not in attempted and \
+                            all(bs[j] == best[j] for j in range(len(best)) if j != i):
+                        attempted.add(bs)
+                        yield bs, nt
+                candidate = min(runs, key=runs.get)
+                if candidate != best:
+                    best = candidate
+                    log("descent step <%s>" % ','.join('%s=%s' % j for j in best))
+            if best == start:
+                # Converged
+                break
 
 
 def generate_nthreads(nthreads, args, level):
@@ -368,6 +513,7 @@ options = {
     'squeezer': 4,
     'blocksize-l0': (8, 16, 24, 32, 64, 96, 128),
     'blocksize-l1': (8, 16, 32),
+    'descent-passes': 2,
     'stack_limit': resource.getrlimit(resource.RLIMIT_STACK)[0] / 4
 }
 """Autotuning options."""
@@ -4,8 +4,9 @@ from devito.core.operator import OperatorCore
 from devito.exceptions import InvalidOperator
 from devito.passes.clusters import (Blocking, Lift, cire, cse, eliminate_arrays,
                                     extract_increments, factorize, fuse, optimize_pows)
-from devito.passes.iet import (DataManager, Ompizer, avoid_denormals, mpiize,
-                               optimize_halospots, hoist_prodders, relax_incr_dimensions)
+from devito.passes.iet import (DataManager, Ompizer, avoid_denormals, make_intrinsics,
+                               mpiize, optimize_halospots, hoist_prodders,
+                               relax_incr_dimensions)
 from devito.tools import as_tuple, timed_pass
 
 __all__ = ['CPU64NoopOperator', 'CPU64Operator', 'CPU64OpenMPOperator',
@@ -59,6 +60,11 @@ class CPU64NoopOperator(OperatorCore):
     known to exceed this threshold.
     """
 
+    PAR_CHUNK_AFFINE = 1
+    """
+    Chunk size in the schedule clause of affine parallel loops.
+    """
+
     PAR_CHUNK_NONAFFINE = 3
     """
     Coefficient to adjust the chunk size in non-affine parallel loops.
@@ -76,6 +82,13 @@ class CPU64NoopOperator(OperatorCore):
     than this threshold.
     """
 
+    PAR_IF_WORK = 0
+    """
+    Only activate a parallel region at runtime if the number of points spanned by
+    its parallel loops exceeds this threshold; otherwise, run it sequentially.
+    A value of 0 means the parallel regions are always active.
+    """
+
     @classmethod
     def _normalize_kwargs(cls, **kwargs):
         o = {}
@@ -104,9 +117,14 @@ class CPU64NoopOperator(OperatorCore):
         # Shared-memory parallelism
         o['par-collapse-ncores'] = oo.pop('par-collapse-ncores', cls.PAR_COLLAPSE_NCORES)
         o['par-collapse-work'] = oo.pop('par-collapse-work', cls.PAR_COLLAPSE_WORK)
+        o['par-chunk-affine'] = oo.pop('par-chunk-affine', cls.PAR_CHUNK_AFFINE)
         o['par-chunk-nonaffine'] = oo.pop('par-chunk-nonaffine', cls.PAR_CHUNK_NONAFFINE)
         o['par-dynamic-work'] = oo.pop('par-dynamic-work', cls.PAR_DYNAMIC_WORK)
         o['par-nested'] = oo.pop('par-nested', cls.PAR_NESTED)
+        o['par-if-work'] = oo.pop('par-if-work', cls.PAR_IF_WORK)
+
+        # SIMD-level parallelism
+        o['intrinsics'] = oo.pop('intrinsics', None)
 
         if oo:
             raise InvalidOperator("Unrecognized optimization options: [%s]"
@@ -198,6 +216,8 @@ class CPU64Operator(CPU64NoopOperator):
         # SIMD-level parallelism
         ompizer = Ompizer(sregistry, options)
         ompizer.make_simd(graph, simd_reg_size=platform.simd_reg_size)
+        if options['intrinsics']:
+            make_intrinsics(graph, isa=options['intrinsics'], sregistry=sregistry)
 
         # Misc optimizations
         hoist_prodders(graph)
@@ -233,6 +253,8 @@ class CPU64OpenMPOperator(CPU64Operator):
         # SIMD-level parallelism
         ompizer = Ompizer(sregistry, options)
         ompizer.make_simd(graph, simd_reg_size=platform.simd_reg_size)
+        if options['intrinsics']:
+            make_intrinsics(graph, isa=options['intrinsics'], sregistry=sregistry)
 
         # Shared-memory parallelism
         ompizer.make_parallel(graph)
@@ -345,13 +367,18 @@ class CustomOperator(CPU64Operator):
 
         ompizer = Ompizer(sregistry, options)
 
+        def simd(graph):
+            ompizer.make_simd(graph, simd_reg_size=platform.simd_reg_size)
+            if options['intrinsics']:
+                make_intrinsics(graph, isa=options['intrinsics'], sregistry=sregistry)
+
         return {
             'denormals': avoid_denormals,
             'optcomms': optimize_halospots,
             'blocking': partial(relax_incr_dimensions, sregistry=sregistry),
             'openmp': ompizer.make_parallel,
             'mpi': partial(mpiize, mode=options['mpi']),
-            'simd': partial(ompizer.make_simd, simd_reg_size=platform.simd_reg_size),
+            'simd': simd,
             'prodders': hoist_prodders
         }
 
@@ -361,6 +388,8 @@ class CustomOperator(CPU64Operator):
         passes = as_tuple(kwargs['mode'])
         if any(i not in cls._known_passes for i in passes):
             raise InvalidOperator("Unknown passes `%s`" % str(passes))
+        if kwargs['options']['intrinsics'] and 'simd' not in passes:
+            raise InvalidOperator("The `intrinsics` option requires the `simd` pass")
 
         return super(CustomOperator, cls)._build(expressions, **kwargs)
 
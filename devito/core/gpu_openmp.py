@@ -261,9 +261,11 @@ class DeviceOpenMPNoopOperator(OperatorCore):
         # GPU parallelism
         o['par-collapse-ncores'] = 1  # Always use a collapse clause
         o['par-collapse-work'] = 1  # Always use a collapse clause
+        o['par-chunk-affine'] = None  # Unused, no schedule clause on the device
         o['par-chunk-nonaffine'] = oo.pop('par-chunk-nonaffine', cls.PAR_CHUNK_NONAFFINE)
         o['par-dynamic-work'] = np.inf  # Always use static scheduling
         o['par-nested'] = np.inf  # Never use nested parallelism
+        o['par-if-work'] = 0  # No if clause
 
         if oo:
             raise InvalidOperator("Unsupported optimization options: [%s]"
@@ -10,7 +10,7 @@ from ctypes.util import find_library
 
 from devito.logger import logger
 from devito.parameters import configuration
-from devito.tools import dtype_to_ctype
+from devito.tools import dtype_to_buffer_ctype
 
 __all__ = ['ALLOC_FLAT', 'ALLOC_NUMA_LOCAL', 'ALLOC_NUMA_ANY',
            'ALLOC_KNL_MCDRAM', 'ALLOC_KNL_DRAM', 'ALLOC_GUARD',
@@ -69,7 +69,7 @@ class MemoryAllocator(object):
             object that is needed only for the "memfree" call.
         """
         size = int(reduce(mul, shape))
-        ctype = dtype_to_ctype(dtype)
+        ctype = dtype_to_buffer_ctype(dtype)
 
         c_pointer, memfree_args = self._alloc_C_libcall(size, ctype)
         if c_pointer is None:
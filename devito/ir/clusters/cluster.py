@@ -183,11 +183,11 @@ class Cluster(object):
         """
         dtypes = {i.dtype for i in self.exprs}
         fdtypes = {i for i in dtypes if np.issubdtype(i, np.floating)}
-        if len(fdtypes) > 1:
-            raise NotImplementedError("Unsupported Cluster with mixed floating "
-                                      "point arithmetic %s" % str(fdtypes))
-        elif len(fdtypes) == 1:
-            return fdtypes.pop()
+        if fdtypes:
+            # Half precision is a storage-only format, so the arithmetic is
+            # carried out in (at least) single precision
+            fdtypes = {np.float32 if i == np.float16 else i for i in fdtypes}
+            return max(fdtypes, key=lambda i: np.dtype(i).itemsize)
         elif len(dtypes) == 1:
             return dtypes.pop()
         else:
@@ -277,11 +277,8 @@ class ClusterGroup(tuple):
         """
         dtypes = {i.dtype for i in self}
         fdtypes = {i for i in dtypes if np.issubdtype(i, np.floating)}
-        if len(fdtypes) > 1:
-            raise NotImplementedError("Unsupported ClusterGroup with mixed floating "
-                                      "point arithmetic %s" % str(fdtypes))
-        elif len(fdtypes) == 1:
-            return fdtypes.pop()
+        if fdtypes:
+            return max(fdtypes, key=lambda i: np.dtype(i).itemsize)
         elif len(dtypes) == 1:
             return dtypes.pop()
         else:
@@ -8,6 +8,7 @@ from collections import OrderedDict, namedtuple
 from collections.abc import Iterable
 
 import cgen as c
+import numpy as np
 
 from devito.data import FULL
 from devito.ir.equations import ClusterizedEq
@@ -290,6 +291,10 @@ class Expression(ExprStmt, Node):
 
     @property
     def dtype(self):
+        # Half precision is a storage-only format; the arithmetic is carried
+        # out in single precision
+        if self.expr.dtype == np.float16:
+            return np.float32
         return self.expr.dtype
 
     @property
@@ -334,7 +339,7 @@ class Expression(ExprStmt, Node):
     def defines(self):
         return (self.write,) if self.is_definition else ()
 
-    @property
+    @cached_property
     def free_symbols(self):
         return tuple(self.expr.free_symbols)
 
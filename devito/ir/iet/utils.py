@@ -97,16 +97,17 @@ def derive_parameters(nodes, drop_locals=False):
     Derive all input parameters (function call arguments) from an IET
     by collecting all symbols not defined in the tree itself.
     """
-    # Pick all free symbols and symbolic functions from the kernel
-    functions = FindSymbols('symbolics').visit(nodes)
-    free_symbols = FindSymbols('free-symbols').visit(nodes)
+    # Pick all free symbols, symbolic functions, and defined symbols from the
+    # kernel, in a single traversal
+    functions, free_symbols, defines = \
+        FindSymbols(('symbolics', 'free-symbols', 'defines')).visit(nodes)
 
     # Filter out function base symbols and use real function objects
     function_names = [s.name for s in functions]
     symbols = [s for s in free_symbols if s.name not in function_names]
     symbols = functions + symbols
 
-    defines = [s.name for s in FindSymbols('defines').visit(nodes)]
+    defines = [s.name for s in defines]
     parameters = tuple(s for s in symbols if s.name not in defines)
 
     # Drop globally-visible objects
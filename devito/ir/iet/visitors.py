@@ -529,12 +529,14 @@ class FindSymbols(Visitor):
 
     Parameters
     ----------
-    mode : str, optional
+    mode : str or tuple of str, optional
         Drive the search. Accepted:
         - ``symbolics``: Collect all AbstractFunction objects, default.
         - ``free-symbols``: Collect all free symbols.
         - ``indexeds``: Collect all Indexeds.
         - ``defines``: Collect all defined (bound) objects.
+        If a tuple of modes is provided, all searches are performed within
+        a single traversal, and a tuple of results (one per mode) is returned.
     """
 
     def _symbolics(e):
@@ -559,34 +561,46 @@ class FindSymbols(Visitor):
 
     def __init__(self, mode='symbolics'):
         super(FindSymbols, self).__init__()
-        self.rule = self.rules[mode]
+        self.multi = isinstance(mode, tuple)
+        self.rule = [self.rules[i] for i in as_tuple(mode)]
+
+    def _post_visit(self, ret):
+        # Duplicates are only dropped, and symbols only sorted, once the whole
+        # tree has been traversed
+        ret = tuple(filter_sorted(i, key=attrgetter('name')) for i in ret)
+        return ret if self.multi else ret[0]
+
+    def _apply(self, e):
+        return tuple(rule(e) for rule in self.rule)
+
+    def _merge(self, handles):
+        return tuple([s for h in handles for s in h[n]] for n in range(len(self.rule)))
+
+    def visit_object(self, o):
+        return tuple([] for _ in self.rule)
 
     def visit_tuple(self, o):
-        symbols = flatten([self._visit(i) for i in o])
-        return filter_sorted(symbols, key=attrgetter('name'))
+        return self._merge([self._visit(i) for i in o])
 
     visit_list = visit_tuple
 
     def visit_Iteration(self, o):
-        symbols = flatten([self._visit(i) for i in o.children])
-        symbols += self.rule(o)
-        return filter_sorted(symbols, key=attrgetter('name'))
+        handles = [self._visit(i) for i in o.children]
+        handles.append(self._apply(o))
+        return self._merge(handles)
 
     visit_List = visit_Iteration
 
     def visit_Conditional(self, o):
-        symbols = flatten([self._visit(i) for i in o.children])
-        symbols += self.rule(o)
-        symbols += self.rule(o.condition)
-        return filter_sorted(symbols, key=attrgetter('name'))
+        handles = [self._visit(i) for i in o.children]
+        handles.extend([self._apply(o), self._apply(o.condition)])
+        return self._merge(handles)
 
     def visit_Expression(self, o):
-        return filter_sorted([f for f in self.rule(o)], key=attrgetter('name'))
+        return self._merge([self._apply(o)])
 
     def visit_Call(self, o):
-        symbols = self._visit(o.children)
-        symbols.extend([f for f in self.rule(o)])
-        return filter_sorted(symbols, key=attrgetter('name'))
+        return self._merge([self._visit(o.children), self._apply(o)])
 
     visit_PointerCast = visit_Expression
     visit_Dereference = visit_Expression
@@ -730,6 +744,10 @@ class Transformer(Visitor):
                     return handle._rebuild(*children, **handle.args_frozen)
                 else:
                     return handle
+        elif not o.children:
+            # Leaves (e.g., Expressions) are reused as they are, thus retaining
+            # any lazily computed properties, such as the accessed Functions
+            return o
         else:
             children = [self._visit(i, **kwargs) for i in o.children]
             return o._rebuild(*children, **o.args_frozen)
@@ -232,7 +232,8 @@ class IntervalGroup(PartialOrderTuple):
         # The relations are between dimensions, not intervals. So we take
         # care of that here
         ordering = filter_ordered(toposort(relations) + [i.dim for i in items])
-        return sorted(items, key=lambda i: ordering.index(i.dim))
+        ranks = {d: n for n, d in enumerate(ordering)}
+        return sorted(items, key=lambda i: ranks[i.dim])
 
     def __eq__(self, o):
         # No need to look at the relations -- if the partial ordering is the same,
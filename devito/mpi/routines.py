@@ -16,7 +16,8 @@ from devito.ir.support import AFFINE, PARALLEL
 from devito.mpi import MPI
 from devito.symbolics import (Byref, CondNe, FieldFromPointer, FieldFromComposite,
                               IndexedPointer, Macro, subs_op_args)
-from devito.tools import OrderedSet, dtype_to_mpitype, dtype_to_ctype, flatten, generator
+from devito.tools import (OrderedSet, dtype_to_mpitype, dtype_to_buffer_ctype, flatten,
+                          generator)
 from devito.types import Array, Dimension, Symbol, LocalObject, CompositeObject
 
 __all__ = ['HaloExchangeBuilder']
@@ -983,7 +984,7 @@ class MPIMsg(CompositeObject):
             entry.sizes = (c_int*len(shape))(*shape)
             # Allocate the send/recv buffers
             size = reduce(mul, shape)
-            ctype = dtype_to_ctype(function.dtype)
+            ctype = dtype_to_buffer_ctype(function.dtype)
             entry.bufg, bufg_memfree_args = self._allocator._alloc_C_libcall(size, ctype)
             entry.bufs, bufs_memfree_args = self._allocator._alloc_C_libcall(size, ctype)
             # The `memfree_args` will be used to deallocate the buffer upon returning
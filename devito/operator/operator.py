@@ -1,10 +1,10 @@
 from collections import OrderedDict
-from functools import reduce
-from operator import attrgetter, mul
+from operator import attrgetter
 from math import ceil
 
 from cached_property import cached_property
 import ctypes
+import numpy as np
 
 from devito.archinfo import platform_registry
 from devito.compiler import compiler_registry
@@ -24,7 +24,7 @@ from devito.parameters import configuration
 from devito.passes import Graph, NThreads, NThreadsNested, NThreadsNonaffine
 from devito.symbolics import estimate_cost, retrieve_functions
 from devito.tools import (DAG, Signer, ReducerMap, as_tuple, flatten, filter_ordered,
-                          filter_sorted, split, timed_pass, timed_region)
+                          filter_sorted, prod, split, timed_pass, timed_region)
 from devito.types import CustomDimension, Dimension, Eq
 
 __all__ = ['Operator']
@@ -56,6 +56,10 @@ class Operator(Callable):
         * compiler : str
             The backend compiler used to jit-compile the generated code.
             Defaults to ``configuration['compiler']``.
+        * profile : bool
+            If False, the generated code is not instrumented with C-level
+            timers, so no per-section performance data is collected at run
+            time. Defaults to True.
 
     Examples
     --------
@@ -237,6 +241,13 @@ class Operator(Callable):
         op._dtype, op._dspace = clusters.meta
         op._profiler = profiler
 
+        # Half precision storage requires compiler support for `_Float16`
+        if any(i.dtype == np.float16 for i in op._input) and \
+                not op._compiler.supports_float16:
+            raise InvalidOperator("Half precision Functions require a compiler "
+                                  "supporting `_Float16`, but `%s` does not"
+                                  % op._compiler)
+
         return op
 
     def __init__(self, *args, **kwargs):
@@ -402,7 +413,8 @@ class Operator(Callable):
         iet = iet_build(stree)
 
         # Instrument the IET for C-level profiling
-        iet = profiler.instrument(iet)
+        if kwargs['profile']:
+            iet = profiler.instrument(iet)
 
         # Lower all DerivedDimensions
         iet = iet_lower_dims(iet)
@@ -479,24 +491,19 @@ class Operator(Callable):
             grid = None
 
         # Process Dimensions
-        # A topological sorting is used so that derived Dimensions are processed after
-        # their parents (note that a leaf Dimension can have an arbitrary long list of
-        # ancestors)
-        dag = DAG(self.dimensions,
-                  [(i, i.parent) for i in self.dimensions if i.is_Derived])
-        for d in reversed(dag.topological_sort()):
-            args.update(d._arg_values(args, self._dspace[d], grid, **kwargs))
+        for d, interval in self._dimensions_argspace:
+            args.update(d._arg_values(args, interval, grid, **kwargs))
 
         # Process Objects (which may need some `args`)
         for o in self.objects:
             args.update(o._arg_values(args, grid=grid, **kwargs))
 
         # Sanity check
-        for p in self.parameters:
-            p._arg_check(args, self._dspace[p])
-        for d in self.dimensions:
+        for p, interval in self._parameters_argspace:
+            p._arg_check(args, interval)
+        for d, interval in self._dimensions_argspace:
             if d.is_Derived:
-                d._arg_check(args, self._dspace[p])
+                d._arg_check(args, interval)
 
         # Turn arguments into a format suitable for the generated code
         # E.g., instead of NumPy arrays for Functions, the generated code expects
@@ -536,6 +543,23 @@ class Operator(Callable):
             except AttributeError:
                 p._arg_apply(args[p.name], kwargs.get(p.name))
 
+    @cached_property
+    def _dimensions_argspace(self):
+        """
+        The Operator Dimensions, paired with their data space, in the order in
+        which their runtime arguments must be processed. A topological sorting
+        is used so that derived Dimensions are processed after their parents
+        (note that a leaf Dimension can have an arbitrary long list of ancestors).
+        """
+        dag = DAG(self.dimensions,
+                  [(i, i.parent) for i in self.dimensions if i.is_Derived])
+        return tuple((d, self._dspace[d]) for d in reversed(dag.topological_sort()))
+
+    @cached_property
+    def _parameters_argspace(self):
+        """The Operator parameters, paired with their data space."""
+        return tuple((p, self._dspace[p]) for p in self.parameters)
+
     @cached_property
     def _known_arguments(self):
         """The arguments that can be passed to ``apply`` when running the Operator."""
@@ -557,10 +581,25 @@ class Operator(Callable):
 
     # JIT compilation
 
+    @cached_property
+    def _ccode_str(self):
+        """
+        The generated C code as a string. While ``ccode`` is memoized, rendering
+        it into a string requires a full traversal of the cgen tree; as an
+        Operator is immutable once built, this is only performed once.
+        """
+        return str(self.ccode)
+
+    def __str__(self):
+        return self._ccode_str
+
+    def _signature_items(self):
+        return (self._ccode_str,)
+
     @cached_property
     def _soname(self):
         """A unique name for the shared object resulting from JIT compilation."""
-        return Signer._digest(self, configuration)
+        return Signer._digest(self, configuration, self._compiler)
 
     def _jit_compile(self):
         """
@@ -572,7 +611,7 @@ class Operator(Callable):
         if self._lib is None:
             with self._profiler.timer_on('jit-compile'):
                 recompiled, src_file = self._compiler.jit_compile(self._soname,
-                                                                  str(self.ccode))
+                                                                  self._ccode_str)
 
             elapsed = self._profiler.py_timers['jit-compile']
             if recompiled:
@@ -812,18 +851,20 @@ class Operator(Callable):
         roots = [self] + [i.root for i in self._func_table.values()]
         functions = [i for i in derive_parameters(roots) if i.is_Function]
 
+        itemsize = self._dtype().itemsize
+
         summary = {}
 
         external = [i.symbolic_shape for i in functions if i._mem_external]
-        external = sum(reduce(mul, i, 1) for i in external)*self._dtype().itemsize
+        external = sum(prod(i) for i in external)*itemsize
         summary['external'] = external
 
         heap = [i.symbolic_shape for i in functions if i._mem_heap]
-        heap = sum(reduce(mul, i, 1) for i in heap)*self._dtype().itemsize
+        heap = sum(prod(i) for i in heap)*itemsize
         summary['heap'] = heap
 
         stack = [i.symbolic_shape for i in functions if i._mem_stack]
-        stack = sum(reduce(mul, i, 1) for i in stack)*self._dtype().itemsize
+        stack = sum(prod(i) for i in stack)*itemsize
         summary['stack'] = stack
 
         summary['total'] = external + heap + stack
@@ -958,6 +999,9 @@ def parse_kwargs(**kwargs):
         mode = 'noop'
     kwargs['mode'] = mode
 
+    # `profile`
+    kwargs['profile'] = kwargs.get('profile', True)
+
     # `platform`
     platform = kwargs.get('platform')
     if platform is not None:
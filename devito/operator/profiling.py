@@ -1,21 +1,20 @@
 from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 from ctypes import c_double
-from functools import reduce
-from operator import mul
 from pathlib import Path
 from time import time as seq_time
 import os
 
 from cached_property import cached_property
+from sympy import lambdify, sympify
 
 from devito.ir.iet import (Call, ExpressionBundle, List, TimedList, Section,
-                           FindNodes, Transformer)
+                           FindNodes, MapNodes, Transformer)
 from devito.ir.support import IntervalGroup
 from devito.logger import warning
 from devito.mpi import MPI
 from devito.parameters import configuration
-from devito.symbolics import subs_op_args
+from devito.tools import filter_sorted, flatten, prod
 from devito.types import CompositeObject
 
 __all__ = ['Timer', 'create_profile']
@@ -56,11 +55,19 @@ class Profiler(object):
         into TimedLists.
         """
         sections = FindNodes(Section).visit(iet)
+
+        # Retrieve the ExpressionBundles within each Section in a single
+        # traversal, rather than re-visiting the tree once per Section
+        found = MapNodes(Section, ExpressionBundle).visit(iet)
+
         for section in sections:
-            bundles = FindNodes(ExpressionBundle).visit(section)
+            bundles = found.get(section, [])
+
+            # The iteration space sizes are symbolic, so they're computed only once
+            sizes = [i.size for i in bundles]
 
             # Total operation count
-            ops = sum(i.ops*i.ispace.size for i in bundles)
+            ops = sum(i.ops*size for i, size in zip(bundles, sizes))
 
             # Operation count at each section iteration
             sops = sum(i.ops for i in bundles)
@@ -72,6 +79,10 @@ class Profiler(object):
                     mapper.setdefault(k, []).append(v)
             traffic = 0
             for i in mapper.values():
+                if len(i) == 1:
+                    # Nothing to unify
+                    traffic += i[0].size
+                    continue
                 try:
                     traffic += IntervalGroup.generate('union', *i).size
                 except ValueError:
@@ -83,10 +94,10 @@ class Profiler(object):
 
             # Track how many grid points are written within `section`
             points = []
-            for i in bundles:
+            for i, size in zip(bundles, sizes):
                 writes = {e.write for e in i.exprs
                           if e.is_tensor and e.write.is_TimeFunction}
-                points.append(i.size*len(writes))
+                points.append(size*len(writes))
             points = sum(points)
 
             self._sections[section] = SectionData(ops, sops, points, traffic, itermaps)
@@ -170,11 +181,42 @@ class Profiler(object):
 
 class AdvancedProfiler(Profiler):
 
+    @cached_property
+    def _metrics(self):
+        """
+        Lower the symbolic performance metrics of all sections -- operation
+        count, grid points, traffic and iteration shapes -- into a single
+        Python function, so that evaluating them at each `apply` doesn't go
+        through SymPy's substitution machinery.
+
+        Returns
+        -------
+        names, func
+            The names of the Operator arguments expected by ``func``, and
+            ``func`` itself, which returns the metrics of all sections as a
+            flat sequence.
+        """
+        exprs = []
+        for data in self._sections.values():
+            exprs.extend([data.ops, data.points, data.traffic])
+            exprs.extend(flatten(i.values() for i in data.itermaps))
+        exprs = [sympify(i) for i in exprs]
+
+        symbols = filter_sorted(set().union(*[i.free_symbols for i in exprs]))
+        func = lambdify(symbols, exprs, modules=[{'Max': max, 'Min': min}, 'math'])
+
+        return [i.name for i in symbols], func
+
     # Override basic summary so that arguments other than runtime are computed.
     def summary(self, args, dtype, reduce_over=None):
         grid = args.grid
         comm = args.comm
 
+        itemsize = dtype().itemsize
+
+        names, func = self._metrics
+        metrics = iter(func(*[args[i] for i in names]))
+
         summary = PerformanceSummary()
         for section, data in self._sections.items():
             name = section.name
@@ -183,17 +225,16 @@ class AdvancedProfiler(Profiler):
             time = max(getattr(args[self.name]._obj, name), 10e-7)
 
             # Number of FLOPs performed
-            ops = int(subs_op_args(data.ops, args))
+            ops = int(next(metrics))
 
             # Number of grid points computed
-            points = int(subs_op_args(data.points, args))
+            points = int(next(metrics))
 
             # Compulsory traffic
-            traffic = float(subs_op_args(data.traffic, args)*dtype().itemsize)
+            traffic = float(next(metrics)*itemsize)
 
             # Runtime itermaps/itershapes
-            itermaps = [OrderedDict([(k, int(subs_op_args(v, args)))
-                                     for k, v in i.items()])
+            itermaps = [OrderedDict([(k, int(next(metrics))) for k in i])
                         for i in data.itermaps]
             itershapes = tuple(tuple(i.values()) for i in itermaps)
 
@@ -226,11 +267,19 @@ class AdvancedProfiler(Profiler):
                     max_t = args[grid.time_dim.max_name] or 0
                     min_t = args[grid.time_dim.min_name] or 0
                     nt = max_t - min_t + 1
-                    points = reduce(mul, (nt,) + grid.shape)
+                    points = prod((nt,) + grid.shape)
                     summary.add_glb_fdlike(points, self.py_timers[reduce_over])
 
         return summary
 
+    # Pickling support
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # The lowered metrics can't be pickled, but they are cheap to rebuild
+        state.pop('_metrics', None)
+        return state
+
 
 class AdvisorProfiler(AdvancedProfiler):
 
@@ -157,6 +157,7 @@ env_vars_mapper = {
     'DEVITO_MPI': 'mpi',
     'DEVITO_LANGUAGE': 'language',
     'DEVITO_AUTOTUNING': 'autotuning',
+    'DEVITO_AUTOTUNING_CACHE': 'autotuning-cache',
     'DEVITO_LOGGING': 'log-level',
     'DEVITO_FIRST_TOUCH': 'first-touch',
     'DEVITO_JIT_BACKDOOR': 'jit-backdoor',
@@ -1,5 +1,6 @@
 from .engine import *  # noqa
 from .openmp import *  # noqa
+from .intrinsics import *  # noqa
 from .mpi import *  # noqa
 from .misc import *  # noqa
 from .definitions import *  # noqa
@@ -245,11 +245,11 @@ class DataManager(object):
         iet : Callable
             The input Iteration/Expression tree.
         """
-        functions = FindSymbols().visit(iet)
+        functions, indexeds = FindSymbols(('symbolics', 'indexeds')).visit(iet)
         need_cast = {i for i in functions if i.is_Tensor}
 
         # Make the generated code less verbose by avoiding unnecessary casts
-        indexed_names = {i.name for i in FindSymbols('indexeds').visit(iet)}
+        indexed_names = {i.name for i in indexeds}
         need_cast = {i for i in need_cast if i.name in indexed_names or i.is_ArrayBasic}
 
         casts = tuple(PointerCast(i) for i in iet.parameters if i in need_cast)
@@ -0,0 +1,180 @@
+from collections import namedtuple
+
+import cgen as c
+import numpy as np
+from sympy import Mul
+
+from devito.ir import (Element, FindNodes, Forward, List, Node, Transformer,
+                       retrieve_iteration_tree)
+from devito.exceptions import InvalidOperator
+from devito.passes.iet.engine import iet_pass
+from devito.symbolics import ccode
+from devito.tools import is_integer
+
+__all__ = ['make_intrinsics']
+
+
+ISA = namedtuple('ISA', 'prefix vtype width guard')
+
+isas = {
+    'avx512': ISA('_mm512', '__m512', 16, 'defined(__AVX512F__)'),
+    'avx2': ISA('_mm256', '__m256', 8, 'defined(__AVX2__) && defined(__FMA__)'),
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+@iet_pass
+def make_intrinsics(iet, **kwargs):
+    """
+    Lower the innermost vectorized Iterations into explicit SIMD intrinsics.
+
+    Only Iterations whose body consists of single-precision Expressions, in
+    which every Indexed varying along the Iteration Dimension is accessed with
+    unit stride, are lowered; all others are left to the compiler's
+    auto-vectorizer. The intrinsics-based loop is guarded by the preprocessor
+    macros of the target ISA, and the original Iteration is retained as a
+    fallback.
+    """
+    sregistry = kwargs['sregistry']
+    try:
+        isa = isas[kwargs['isa']]
+    except KeyError:
+        raise InvalidOperator("Unsupported ISA `%s` for intrinsics lowering; "
+                              "accepted: %s" % (kwargs['isa'], list(isas)))
+
+    mapper = {}
+    for tree in retrieve_iteration_tree(iet):
+        candidate = tree[-1]
+        if candidate in mapper or not candidate.is_Vectorized:
+            continue
+        if candidate.uindices or candidate.step != 1 or candidate.direction != Forward:
+            continue
+
+        try:
+            body = _lower_body(candidate, isa, sregistry)
+        except Unsupported:
+            continue
+
+        # Iterate over the "main" region in steps of the SIMD width, then over
+        # the "remainder" region with the original, scalar Iteration
+        maxv = candidate.symbolic_max - (candidate.symbolic_size % isa.width)
+        vector = candidate._rebuild(nodes=body, pragmas=None,
+                                    limits=(candidate.symbolic_min, maxv, isa.width))
+        remainder = candidate._rebuild(limits=(maxv + 1, candidate.symbolic_max, 1))
+
+        mapper[candidate] = List(header=c.Line('#if %s' % isa.guard),
+                                 body=(vector, remainder,
+                                       Element(c.Line('#else')), candidate),
+                                 footer=c.Line('#endif'))
+
+    if not mapper:
+        return iet, {}
+
+    iet = Transformer(mapper).visit(iet)
+
+    return iet, {'includes': ('immintrin.h',)}
+
+
+def _lower_body(iteration, isa, sregistry):
+    """
+    Translate the Expressions within ``iteration`` into a sequence of cgen
+    statements operating on SIMD registers. Raise Unsupported if any of the
+    Expressions cannot be translated.
+    """
+    nodes = FindNodes(Node).visit(iteration.nodes)
+    if any(not (i.is_Expression or i.is_ExpressionBundle) for i in nodes):
+        raise Unsupported
+    exprs = [i for i in nodes if i.is_Expression]
+    if any(i.is_Increment or i.is_ForeignExpression or i.dtype != np.float32
+           for i in exprs):
+        raise Unsupported
+
+    dim = iteration.dim
+    vtemps = {}
+
+    body = []
+    for e in exprs:
+        rhs = _lower_expr(e.expr.rhs, dim, vtemps, isa)
+        lhs = e.expr.lhs
+        if lhs.is_Symbol:
+            name = sregistry.make_name(prefix='v')
+            vtemps[lhs] = name
+            body.append(Element(c.Initializer(c.Value(isa.vtype, name), rhs)))
+        elif lhs.is_Indexed and _is_unit_stride(lhs, dim):
+            body.append(Element(c.Statement('%s_storeu_ps(&%s, %s)' %
+                                            (isa.prefix, ccode(lhs), rhs))))
+        else:
+            raise Unsupported
+
+    return tuple(body)
+
+
+def _is_unit_stride(indexed, dim):
+    *indices, last = indexed.indices
+    return (indexed.function.dtype == np.float32 and
+            all(dim not in i.free_symbols for i in indices) and
+            dim not in (last - dim).free_symbols)
+
+
+def _lower_expr(expr, dim, vtemps, isa):
+    """
+    Translate the SymPy expression ``expr`` into a string of nested intrinsics.
+    Sub-expressions invariant in ``dim`` are broadcast to all SIMD lanes, while
+    sums of products are turned into chains of fused multiply-adds.
+    """
+    def invariant(i):
+        return not (i.free_symbols & ({dim} | set(vtemps)))
+
+    def lower(i):
+        return _lower_expr(i, dim, vtemps, isa)
+
+    if invariant(expr):
+        return '%s_set1_ps(%s)' % (isa.prefix, ccode(expr))
+    elif expr in vtemps:
+        return vtemps[expr]
+    elif expr.is_Indexed:
+        if not _is_unit_stride(expr, dim):
+            raise Unsupported
+        return '%s_loadu_ps(&%s)' % (isa.prefix, ccode(expr))
+    elif expr.is_Add:
+        # Plain terms first, so that the products can be fused into them
+        terms = sorted(expr.args, key=lambda i: i.is_Mul and not invariant(i))
+        ret = None
+        for i in terms:
+            if ret is not None and i.is_Mul and not invariant(i):
+                head, tail = _split_mul(i, invariant)
+                ret = '%s_fmadd_ps(%s, %s, %s)' % (isa.prefix, lower(head),
+                                                   lower(tail), ret)
+            elif ret is None:
+                ret = lower(i)
+            else:
+                ret = '%s_add_ps(%s, %s)' % (isa.prefix, ret, lower(i))
+        return ret
+    elif expr.is_Mul:
+        head, tail = _split_mul(expr, invariant)
+        return '%s_mul_ps(%s, %s)' % (isa.prefix, lower(head), lower(tail))
+    elif expr.is_Pow and is_integer(expr.exp) and expr.exp != 0:
+        ret = lower(expr.base)
+        for _ in range(abs(int(expr.exp)) - 1):
+            ret = '%s_mul_ps(%s, %s)' % (isa.prefix, ret, lower(expr.base))
+        if expr.exp < 0:
+            ret = '%s_div_ps(%s_set1_ps(1.0F), %s)' % (isa.prefix, isa.prefix, ret)
+        return ret
+    else:
+        raise Unsupported
+
+
+def _split_mul(expr, invariant):
+    """
+    Split the product ``expr`` into two factors, the first of which collects
+    all of the invariant factors, if any.
+    """
+    factors = sorted(expr.args, key=lambda i: not invariant(i))
+    inv = [i for i in factors if invariant(i)]
+    if inv:
+        return Mul(*inv), Mul(*factors[len(inv):])
+    else:
+        return factors[0], Mul(*factors[1:])
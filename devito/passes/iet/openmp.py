@@ -2,13 +2,13 @@ import os
 
 import numpy as np
 import cgen as c
-from sympy import Or, Max, Not
+from sympy import Gt, Or, Max, Not
 
 from devito.ir import (DummyEq, Conditional, Dereference, Expression, ExpressionBundle,
                        List, Prodder, ParallelIteration, ParallelBlock, While,
                        FindSymbols, FindNodes, Return, COLLAPSED, VECTORIZED, Transformer,
                        IsPerfectIteration, retrieve_iteration_tree, filter_iterations)
-from devito.symbolics import CondEq, DefFunction, INT
+from devito.symbolics import CondEq, DefFunction, INT, ccode
 from devito.parameters import configuration
 from devito.passes.iet.engine import iet_pass
 from devito.tools import as_tuple, is_integer, prod
@@ -74,15 +74,19 @@ class NThreadsNonaffine(NThreads):
 
 class OpenMPRegion(ParallelBlock):
 
-    def __init__(self, body, nthreads, private=None):
-        header = OpenMPRegion._make_header(nthreads, private)
+    def __init__(self, body, nthreads, private=None, condition=None):
+        header = OpenMPRegion._make_header(nthreads, private, condition)
         super(OpenMPRegion, self).__init__(header=header, body=body)
         self.nthreads = nthreads
+        self.condition = condition
 
     @classmethod
-    def _make_header(cls, nthreads, private=None):
+    def _make_header(cls, nthreads, private=None, condition=None):
         private = ('private(%s)' % ','.join(private)) if private else ''
-        return c.Pragma('omp parallel num_threads(%s) %s' % (nthreads.name, private))
+        header = 'omp parallel num_threads(%s) %s' % (nthreads.name, private)
+        if condition is not None:
+            header = '%s if(%s)' % (header.rstrip(), ccode(condition))
+        return c.Pragma(header)
 
 
 class OpenMPIteration(ParallelIteration):
@@ -229,17 +233,23 @@ class Ompizer(object):
             appear in the IET (e.g., `sregistry.threadid`, `sregistry.nthreads`).
         options : dict
              The optimization options. Accepted: ['par-collapse-ncores',
-             'par-collapse-work', 'par-chunk-nonaffine', 'par-dynamic-work', 'par-nested']
+             'par-collapse-work', 'par-chunk-affine', 'par-chunk-nonaffine',
+             'par-dynamic-work', 'par-nested', 'par-if-work']
              * 'par-collapse-ncores': use a collapse clause if the number of
                available physical cores is greater than this threshold.
              * 'par-collapse-work': use a collapse clause if the trip count of the
                collapsable Iterations is statically known to exceed this threshold.
+             * 'par-chunk-affine': chunk size in the schedule clause of affine
+               parallel Iterations.
              * 'par-chunk-nonaffine': coefficient to adjust the chunk size in
                non-affine parallel Iterations.
              * 'par-dynamic-work': use dynamic scheduling if the operation count per
                iteration exceeds this threshold. Otherwise, use static scheduling.
              * 'par-nested': nested parallelism if the number of hyperthreads per core
                is greater than this threshold.
+             * 'par-if-work': use an if clause so that a parallel region is only
+               activated if the number of points spanned by its parallel
+               Iterations exceeds this threshold at runtime. 0 means no if clause.
         key : callable, optional
             Return True if an Iteration can be parallelized, False otherwise.
         """
@@ -247,9 +257,11 @@ class Ompizer(object):
 
         self.collapse_ncores = options['par-collapse-ncores']
         self.collapse_work = options['par-collapse-work']
+        self.chunk_affine = options['par-chunk-affine']
         self.chunk_nonaffine = options['par-chunk-nonaffine']
         self.dynamic_work = options['par-dynamic-work']
         self.nested = options['par-nested']
+        self.if_work = options['par-if-work']
 
         if key is not None:
             self.key = key
@@ -357,15 +369,15 @@ class Ompizer(object):
             else:
                 schedule = 'static'
             if nthreads is None:
-                # pragma omp for ... schedule(..., 1)
+                # pragma omp for ... schedule(..., chunk)
                 nthreads = self.nthreads
                 body = OpenMPIteration(schedule=schedule, ncollapse=ncollapse,
-                                       **root.args)
+                                       chunk_size=self.chunk_affine, **root.args)
             else:
-                # pragma omp parallel for ... schedule(..., 1)
+                # pragma omp parallel for ... schedule(..., chunk)
                 body = OpenMPIteration(schedule=schedule, parallel=True,
                                        ncollapse=ncollapse, nthreads=nthreads,
-                                       **root.args)
+                                       chunk_size=self.chunk_affine, **root.args)
             prefix = []
         else:
             # pragma omp for ... schedule(..., expr)
@@ -386,7 +398,7 @@ class Ompizer(object):
 
         return root, partree, collapsed
 
-    def _make_parregion(self, partree, parrays):
+    def _make_parregion(self, partree, parrays, collapsed):
         arrays = [i for i in FindSymbols().visit(partree) if i.is_Array]
 
         # Detect thread-private arrays on the stack
@@ -411,7 +423,13 @@ class Ompizer(object):
         else:
             body = partree
 
-        return OpenMPRegion(body, partree.nthreads, stack_private)
+        # Only activate the parallel region if there's enough work
+        if self.if_work > 0:
+            condition = Gt(prod(i.symbolic_size for i in collapsed), self.if_work)
+        else:
+            condition = None
+
+        return OpenMPRegion(body, partree.nthreads, stack_private, condition)
 
     def _make_guard(self, partree, collapsed):
         # Do not enter the parallel region if the step increment is 0; this
@@ -490,7 +508,7 @@ class Ompizer(object):
             partree = self._make_threaded_prodders(partree)
 
             # Wrap within a parallel region, declaring private and shared variables
-            parregion = self._make_parregion(partree, parrays)
+            parregion = self._make_parregion(partree, parrays, collapsed)
 
             # Protect the parallel region in case of 0-valued step increments
             parregion = self._make_guard(parregion, collapsed)
@@ -530,9 +548,12 @@ class Ompizer(object):
                 continue
             candidate = candidates[-1]
 
-            # Construct OpenMP SIMD pragma
+            # Construct OpenMP SIMD pragma. The aligned clause lists all pointers
+            # whose base address is known to be a multiple of the SIMD register
+            # size, that is the DiscreteFunctions and the heap-allocated Arrays
             aligned = [j for j in FindSymbols('symbolics').visit(candidate)
-                       if j.is_DiscreteFunction]
+                       if (j.is_DiscreteFunction or (j.is_Array and j._mem_heap))
+                       and j._data_alignment % simd_reg_size == 0]
             if aligned:
                 simd = self.lang['simd-for-aligned']
                 simd = as_tuple(simd(','.join([j.name for j in aligned]),
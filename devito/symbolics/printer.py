@@ -7,6 +7,8 @@ import numpy as np
 from mpmath.libmp import prec_to_dps, to_str
 from sympy.printing.ccode import C99CodePrinter
 
+from devito.tools import dtype_to_cstr
+
 __all__ = ['ccode']
 
 
@@ -26,6 +28,8 @@ class CodePrinter(C99CodePrinter):
         self.dtype = dtype
         C99CodePrinter.__init__(self, settings)
         self.known_functions.update(self.custom_functions)
+        # The same index expressions typically recur across many Indexeds
+        self._indices_cache = {}
 
     def _print_Function(self, expr):
         # There exist no unknown Functions
@@ -44,10 +48,22 @@ class CodePrinter(C99CodePrinter):
         --------
         U[t,x,y,z] -> U[t][x][y][z]
         """
-        output = self._print(expr.base.label) \
-            + ''.join(['[' + self._print(x) + ']' for x in expr.indices])
-
-        return output
+        indices = []
+        for i in expr.indices:
+            try:
+                indices.append(self._indices_cache[i])
+            except KeyError:
+                indices.append(self._indices_cache.setdefault(i, self._print(i)))
+
+        ret = self._print(expr.base.label) + ''.join('[%s]' % i for i in indices)
+
+        # Loads from half precision storage are promoted, so that the arithmetic
+        # is carried out in the precision of the enclosing expression
+        if self._print_level > 1 and getattr(expr, 'dtype', None) == np.float16 \
+                and self.dtype != np.float16:
+            ret = '(%s)%s' % (dtype_to_cstr(self.dtype), ret)
+
+        return ret
 
     def _print_Rational(self, expr):
         """Print a Rational as a C-like float/float division."""
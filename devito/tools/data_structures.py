@@ -90,18 +90,18 @@ class ReducerMap(MultiDict):
             Key for which to retrieve a unique value.
         """
         candidates = self.getall(key)
+        first = candidates[0]
+        if len(candidates) == 1:
+            return first
 
         def compare_to_first(v):
-            first = candidates[0]
             if isinstance(first, np.ndarray) or isinstance(v, np.ndarray):
                 return (first == v).all()
             else:
                 return first == v
 
-        if len(candidates) == 1:
-            return candidates[0]
-        elif all(map(compare_to_first, candidates)):
-            return candidates[0]
+        if all(map(compare_to_first, candidates[1:])):
+            return first
         else:
             raise ValueError("Unable to find unique value for key %s, candidates: %s"
                              % (key, candidates))
@@ -131,7 +131,9 @@ class ReducerMap(MultiDict):
 
     def reduce_all(self):
         """Returns a dictionary with reduced/unique values for all keys."""
-        return {k: self.reduce(key=k) for k in self}
+        # NOTE: iterating over a MultiDict yields a key once per value, so
+        # the keys are uniqued first to reduce each of them only once
+        return {k: self.reduce(key=k) for k in dict.fromkeys(self)}
 
 
 class DefaultOrderedDict(OrderedDict):
@@ -12,7 +12,8 @@ from cgen import dtype_to_ctype as cgen_dtype_to_ctype
 
 __all__ = ['prod', 'as_tuple', 'is_integer', 'generator', 'grouper', 'split', 'roundm',
            'powerset', 'invert', 'flatten', 'single_or', 'filter_ordered', 'as_mapper',
-           'filter_sorted', 'dtype_to_cstr', 'dtype_to_ctype', 'dtype_to_mpitype',
+           'filter_sorted', 'dtype_to_cstr', 'dtype_to_ctype', 'dtype_to_buffer_ctype',
+           'dtype_to_mpitype',
            'ctypes_to_cstr', 'ctypes_pointer', 'pprint', 'sweep', 'all_equal', 'as_list']
 
 
@@ -164,7 +165,7 @@ def filter_ordered(elements, key=None):
             unordered, inds = np.unique(elements, return_index=True)
             return unordered[np.argsort(inds)].tolist()
         except:
-            return sorted(list(set(elements)), key=elements.index)
+            return list(dict.fromkeys(elements))
     return [e for e in elements if not (key(e) in seen or seen.add(key(e)))]
 
 
@@ -180,6 +181,9 @@ def filter_sorted(elements, key=None):
 
 def dtype_to_cstr(dtype):
     """Translate numpy.dtype into C string."""
+    if dtype == np.float16:
+        # Storage-only half precision type, see `Compiler.supports_float16`
+        return '_Float16'
     return cgen_dtype_to_ctype(dtype)
 
 
@@ -191,6 +195,19 @@ def dtype_to_ctype(dtype):
             np.float64: ctypes.c_double}[dtype]
 
 
+def dtype_to_buffer_ctype(dtype):
+    """
+    Translate numpy.dtype into the ctypes type of the elements of a data buffer.
+    Unlike ``dtype_to_ctype``, half precision is supported, since ctypes lacks a
+    half precision type but np.float16 buffers can be reinterpreted as 16-bit
+    unsigned integers. This must not be used for scalars, as a Python float
+    would be passed by value as an integer.
+    """
+    if dtype == np.float16:
+        return ctypes.c_uint16
+    return dtype_to_ctype(dtype)
+
+
 def dtype_to_mpitype(dtype):
     """Map numpy types to MPI datatypes."""
     return {np.int32: 'MPI_INT',
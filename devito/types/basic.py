@@ -1095,9 +1095,12 @@ class CompositeObject(Object):
 
     @classmethod
     def _generate_unique_dtype(cls, pname, pfields):
-        dtype = POINTER(type(pname, (Structure,), {'_fields_': pfields}))
         key = (pname, tuple(pfields))
-        return cls._dtype_cache.setdefault(key, dtype)
+        try:
+            return cls._dtype_cache[key]
+        except KeyError:
+            dtype = POINTER(type(pname, (Structure,), {'_fields_': pfields}))
+            return cls._dtype_cache.setdefault(key, dtype)
 
     def __init__(self, name, pname, pfields, value=None):
         dtype = CompositeObject._generate_unique_dtype(pname, pfields)
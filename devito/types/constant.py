@@ -20,7 +20,8 @@ class Constant(DataSymbol, ArgProvider):
         Name of the symbol.
     dtype : data-type, optional
         Any object that can be interpreted as a numpy data type. Defaults
-        to ``np.float32``.
+        to ``np.float32``. Half precision is a storage-only format, hence it
+        is not supported.
 
     Examples
     --------
@@ -49,7 +50,10 @@ class Constant(DataSymbol, ArgProvider):
 
     @classmethod
     def __dtype_setup__(cls, **kwargs):
-        return kwargs.get('dtype', np.float32)
+        dtype = kwargs.get('dtype', np.float32)
+        if dtype == np.float16:
+            raise TypeError("Half precision is only supported for Functions")
+        return dtype
 
     @property
     def is_const(self):
@@ -20,7 +20,7 @@ from devito.parameters import configuration
 from devito.symbolics import FieldFromPointer
 from devito.finite_differences import Differentiable, generate_fd_shortcuts
 from devito.tools import (ReducerMap, as_tuple, flatten, is_integer,
-                          ctypes_to_cstr, memoized_meth, dtype_to_ctype)
+                          ctypes_to_cstr, memoized_meth, dtype_to_buffer_ctype)
 from devito.types.dimension import Dimension
 from devito.types.args import ArgProvider
 from devito.types.caching import CacheManager
@@ -75,6 +75,7 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
 
         # Data-related properties and data initialization
         self._data = None
+        self._C_dataobj = None
         self._first_touch = kwargs.get('first_touch', configuration['first-touch'])
         self._allocator = kwargs.get('allocator', default_allocator())
         initializer = kwargs.get('initializer')
@@ -640,7 +641,16 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         """
         A ctypes object representing the DiscreteFunction that can be passed to
         an Operator.
+
+        If ``data`` is the DiscreteFunction's own buffer, which is typically the
+        case across consecutive runs of an Operator, the object is built only
+        once and then reused. Objects for any other buffer (e.g., user-provided
+        arrays) are never cached, as they would otherwise keep the buffer alive.
         """
+        key = (data.ctypes.data, data.shape, data.strides, data.dtype)
+        if self._C_dataobj is not None and self._C_dataobj[0] == key:
+            return self._C_dataobj[1]
+
         dataobj = byref(self._C_ctype._type_())
         dataobj._obj.data = data.ctypes.data_as(c_void_p)
         dataobj._obj.size = (c_int*self.ndim)(*data.shape)
@@ -656,12 +666,17 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         # while we hold onto _obj
         dataobj._obj.underlying_array = data
 
+        own = self._data
+        if own is not None and \
+                key == (own.ctypes.data, own.shape, own.strides, own.dtype):
+            self._C_dataobj = (key, dataobj)
+
         return dataobj
 
     def _C_as_ndarray(self, dataobj):
         """Cast the data carried by a DiscreteFunction dataobj to an ndarray."""
         shape = tuple(dataobj._obj.size[i] for i in range(self.ndim))
-        ctype_1d = dtype_to_ctype(self.dtype) * int(reduce(mul, shape))
+        ctype_1d = dtype_to_buffer_ctype(self.dtype) * int(reduce(mul, shape))
         buf = cast(dataobj._obj.data, POINTER(ctype_1d)).contents
         return np.frombuffer(buf, dtype=self.dtype).reshape(shape)
 
@@ -4,18 +4,23 @@ import numpy as np
 from conftest import skipif
 from devito import Grid, TimeFunction, Eq, Operator, configuration, switchconfig
 from devito.data import LEFT
-from devito.core.autotuning import options  # noqa
+from devito.core.autotuning import cache_file, options  # noqa
 
 
 @switchconfig(log_level='DEBUG')
 @pytest.mark.parametrize("shape,expected", [
-    ((30, 30), 13),
-    ((30, 30, 30), 17)
+    ((30, 30), 16),
+    ((30, 30, 30), 22)
 ])
 def test_at_is_actually_working(shape, expected):
     """
     Check that autotuning is actually running when switched on,
     in both 2D and 3D operators.
+
+    In aggressive mode, the number of runs depends on the path taken by the
+    coordinate descent, hence only an upper bound can be checked. Here, there
+    are 4 block sizes (8, 16, 24, 30) for each blocked Dimension, so the bound
+    is 4 initial runs plus (4 - 1) runs per Dimension, for each of the 2 passes.
     """
     grid = Grid(shape=shape)
     f = TimeFunction(name='f', grid=grid)
@@ -31,18 +36,18 @@ def test_at_is_actually_working(shape, expected):
     # Now try `aggressive` autotuning
     configuration['autotuning'] = 'aggressive'
     op(time_M=0, autotune=True)
-    assert op._state['autotuning'][-1]['runs'] == expected
+    assert 4 < op._state['autotuning'][-1]['runs'] <= expected
     assert op._state['autotuning'][-1]['tpr'] == options['squeezer'] + 1
     configuration['autotuning'] = configuration._defaults['autotuning']
 
     # Try again, but using the Operator API directly
     op(time_M=0, autotune='aggressive')
-    assert op._state['autotuning'][-1]['runs'] == expected
+    assert 4 < op._state['autotuning'][-1]['runs'] <= expected
     assert op._state['autotuning'][-1]['tpr'] == options['squeezer'] + 1
 
     # Similar to above
     op(time_M=0, autotune=('aggressive', 'preemptive'))
-    assert op._state['autotuning'][-1]['runs'] == expected
+    assert 4 < op._state['autotuning'][-1]['runs'] <= expected
     assert op._state['autotuning'][-1]['tpr'] == options['squeezer'] + 1
 
 
@@ -110,6 +115,58 @@ def test_blocking_only():
     assert 'nthreads' not in op._state['autotuning'][0]['tuned']
 
 
+@switchconfig(autotuning_cache=True)
+def test_cache():
+    grid = Grid(shape=(64, 64, 64))
+    f = TimeFunction(name='f', grid=grid)
+
+    op = Operator(Eq(f.forward, f + 1.), openmp=False)
+    try:
+        cache_file(op).unlink()
+    except FileNotFoundError:
+        pass
+
+    op.apply(time=0, autotune=True)
+    assert op._state['autotuning'][0]['runs'] > 0
+    assert cache_file(op).exists()
+
+    # A warm run skips autotuning
+    op.apply(time=0, autotune=True)
+    assert op._state['autotuning'][1]['runs'] == 0
+    assert op._state['autotuning'][1]['tuned'] == op._state['autotuning'][0]['tuned']
+
+    # Same for a new, identical, Operator
+    op1 = Operator(Eq(f.forward, f + 1.), openmp=False)
+    op1.apply(time=0, autotune=True)
+    assert op1._state['autotuning'][0]['runs'] == 0
+
+    # But not over a different iteration space
+    op1.apply(time=0, x_M=31, autotune=True)
+    assert op1._state['autotuning'][1]['runs'] > 0
+
+
+@switchconfig(autotuning_cache=True)
+def test_cache_runtime_early_stop():
+    grid = Grid(shape=(32, 32, 32))
+    f = TimeFunction(name='f', grid=grid)
+
+    # Not to share the cache file with `test_cache`
+    op = Operator(Eq(f.forward, f + 2.), openmp=False)
+    try:
+        cache_file(op).unlink()
+    except FileNotFoundError:
+        pass
+
+    # Too few timesteps to attempt all candidates
+    op.apply(time_M=20, autotune=('aggressive', 'runtime'))
+    assert op._state['autotuning'][0]['runs'] > 0
+    assert not cache_file(op).exists()
+
+    # The partial outcome isn't reused
+    op.apply(time_M=20, autotune=('aggressive', 'runtime'))
+    assert op._state['autotuning'][1]['runs'] > 0
+
+
 def test_mixed_blocking_nthreads():
     grid = Grid(shape=(96, 96, 96))
     f = TimeFunction(name='f', grid=grid)
@@ -128,7 +185,8 @@ def test_tti_aggressive():
     wave_solver = TestTTI().tti_operator(opt='advanced')
     op = wave_solver.op_fwd(kernel='centered')
     op.apply(time=0, autotune='aggressive')
-    assert op._state['autotuning'][0]['runs'] == 30
+    # 6 initial runs, then at most 2 passes of (6 - 1) runs per blocked Dimension
+    assert 6 < op._state['autotuning'][0]['runs'] <= 26
 
 
 @switchconfig(develop_mode=False)
@@ -138,20 +196,33 @@ def test_discarding_runs():
 
     op = Operator(Eq(f.forward, f + 1.),
                   opt=('advanced', {'openmp': True, 'par-collapse-ncores': 1}))
+
+    # In basic mode, the block shapes attempted are (8, 8), (16, 16), (24, 24),
+    # (32, 32) and (64, 64). The latter is discarded as it would leave three
+    # threads out of four without blocks
+    op.apply(time=100, nthreads=4, autotune='basic')
+    assert op._state['autotuning'][0]['runs'] == 4
+    assert op._state['autotuning'][0]['tuned']['x0_blk0_size'] < 64
+
+    # With 1 < 4 threads, no runs are discarded
+    op.apply(time=100, nthreads=1, autotune='basic')
+    assert op._state['autotuning'][1]['runs'] == 5
+
+    # Same story in aggressive mode, though the number of runs depends on the
+    # path taken by the coordinate descent
     op.apply(time=100, nthreads=4, autotune='aggressive')
 
-    assert op._state['autotuning'][0]['runs'] == 18
-    assert op._state['autotuning'][0]['tpr'] == options['squeezer'] + 1
-    assert len(op._state['autotuning'][0]['tuned']) == 3
-    assert op._state['autotuning'][0]['tuned']['nthreads'] == 4
+    assert op._state['autotuning'][2]['runs'] <= 21
+    assert op._state['autotuning'][2]['tpr'] == options['squeezer'] + 1
+    assert len(op._state['autotuning'][2]['tuned']) == 3
+    assert op._state['autotuning'][2]['tuned']['nthreads'] == 4
 
-    # With 1 < 4 threads, the AT eventually tries many more combinations
     op.apply(time=100, nthreads=1, autotune='aggressive')
 
-    assert op._state['autotuning'][1]['runs'] == 25
-    assert op._state['autotuning'][1]['tpr'] == options['squeezer'] + 1
-    assert len(op._state['autotuning'][1]['tuned']) == 3
-    assert op._state['autotuning'][1]['tuned']['nthreads'] == 1
+    assert 5 < op._state['autotuning'][3]['runs'] <= 21
+    assert op._state['autotuning'][3]['tpr'] == options['squeezer'] + 1
+    assert len(op._state['autotuning'][3]['tuned']) == 3
+    assert op._state['autotuning'][3]['tuned']['nthreads'] == 1
 
 
 @skipif('nompi')
@@ -229,7 +300,7 @@ def test_multiple_blocking():
 
     # 'aggressive' mode
     op.apply(time_M=0, autotune='aggressive')
-    assert op._state['autotuning'][1]['runs'] == 60
+    assert 12 < op._state['autotuning'][1]['runs'] <= 52  # <= 26 for each nest
     assert op._state['autotuning'][1]['tpr'] == options['squeezer'] + 1
     assert len(op._state['autotuning'][1]['tuned']) == 4
 
@@ -259,7 +330,9 @@ def test_hierarchical_blocking():
 
     # 'aggressive' mode
     op.apply(time_M=0, autotune='aggressive')
-    assert op._state['autotuning'][1]['runs'] == 38
+    # 10 initial runs, then at most 2 passes of (5 - 1) runs per block Dimension
+    # and (3 - 1) runs per sub-block Dimension
+    assert 10 < op._state['autotuning'][1]['runs'] <= 34
     assert op._state['autotuning'][1]['tpr'] == options['squeezer'] + 1
     assert len(op._state['autotuning'][1]['tuned']) == 4
 
@@ -276,7 +349,8 @@ def test_multiple_threads():
 
     op = Operator(Eq(v.forward, v + 1), opt=('blocking', {'openmp': True}))
     op.apply(time_M=0, autotune='max')
-    assert op._state['autotuning'][0]['runs'] == 60  # Would be 30 with `aggressive`
+    # At most 26 runs for each of the two attempted `nthreads`
+    assert 12 < op._state['autotuning'][0]['runs'] <= 52
     assert op._state['autotuning'][0]['tpr'] == options['squeezer'] + 1
     assert len(op._state['autotuning'][0]['tuned']) == 3
 
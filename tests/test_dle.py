@@ -3,10 +3,11 @@ from operator import mul
 
 import numpy as np
 import pytest
+from sympy import sin
 
 from devito import (Grid, Function, TimeFunction, SparseTimeFunction, SubDimension,
-                    Eq, Operator)
-from devito.exceptions import InvalidArgument
+                    Eq, Operator, configuration)
+from devito.exceptions import InvalidArgument, InvalidOperator
 from devito.ir.iet import Call, Iteration, Conditional, FindNodes, retrieve_iteration_tree
 from devito.passes import NThreads, NThreadsNonaffine
 from devito.passes.iet.openmp import OpenMPRegion
@@ -523,6 +524,47 @@ class TestNodeParallelism(object):
         assert not iterations[3].is_Affine
         assert 'schedule(dynamic,chunk_size)' in iterations[3].pragmas[0].value
 
+    def test_chunk_and_if_clauses(self):
+        grid = Grid(shape=(11, 11))
+
+        u = TimeFunction(name='u', grid=grid)
+
+        op = Operator(Eq(u.forward, u + 1),
+                      opt=('openmp', {'par-chunk-affine': 4, 'par-if-work': 100}))
+
+        parregions = FindNodes(OpenMPRegion).visit(op)
+        assert len(parregions) == 1
+        assert str(parregions[0].header[0]) == ('#pragma omp parallel '
+                                                'num_threads(nthreads) '
+                                                'if(x_M - x_m + 1 > 100)')
+
+        iterations = FindNodes(Iteration).visit(op)
+        assert 'schedule(static,4)' in iterations[1].pragmas[0].value
+
+        # Below the threshold, the parallel region runs sequentially
+        op.apply(time_M=1)
+        assert np.all(u.data[0] == 2.)
+
+    def test_simd_aligned(self):
+        grid = Grid(shape=(16, 16, 16))
+
+        f = Function(name='f', grid=grid, space_order=4)
+        u = TimeFunction(name='u', grid=grid, space_order=4)
+
+        eqn = Eq(u.forward, (u*f).dx.dy + (u*f).dy.dx + 1)
+        op = Operator(eqn, opt=('advanced', {'openmp': True, 'cire-mincost-sops': 1}))
+
+        # The heap-allocated temporaries, as well as the Functions, must appear
+        # in the aligned clause
+        arrays = [i for i in op._func_table['bf0'].root.parameters if i.is_PointerArray]
+        assert len(arrays) == 2
+        simd_reg_size = configuration['platform'].simd_reg_size
+        iterations = [i for i in FindNodes(Iteration).visit(op._func_table['bf0'])
+                      if i.is_Vectorized]
+        assert len(iterations) == 2
+        assert iterations[0].pragmas[-1].value == \
+            'omp simd aligned(f,r8,r9,u:%d)' % simd_reg_size
+
 
 class TestNestedParallelism(object):
 
@@ -610,3 +652,63 @@ class TestNestedParallelism(object):
         assert trees[1][2].pragmas[0].value == ('omp parallel for collapse(2) '
                                                 'schedule(dynamic,1) '
                                                 'num_threads(nthreads_nested)')
+
+
+class TestIntrinsics(object):
+
+    @pytest.mark.parametrize('isa,prefix,width', [
+        ('avx512', '_mm512', 16),
+        ('avx2', '_mm256', 8),
+    ])
+    def test_basic(self, isa, prefix, width):
+        grid = Grid(shape=(12, 12, 21))
+
+        u = TimeFunction(name='u', grid=grid, space_order=8)
+        u1 = TimeFunction(name='u', grid=grid, space_order=8)
+        u.data[:] = np.linspace(0., 1., u.data.size).reshape(u.shape)
+        u1.data[:] = u.data[:]
+
+        eqn = Eq(u.forward, u + 1e-4*u.laplace)
+        op0 = Operator(eqn, opt='advanced')
+        op1 = Operator(eqn, opt=('advanced', {'intrinsics': isa}))
+
+        # The vectorized Iteration steps by the SIMD width, followed by the
+        # remainder Iteration and the fallback Iteration
+        z = grid.dimensions[-1]
+        iterations = [i for i in FindNodes(Iteration).visit(op1._func_table['bf0'])
+                      if i.dim is z]
+        assert len(iterations) == 3
+        assert [i.step for i in iterations] == [width, 1, 1]
+        assert '%s_fmadd_ps' % prefix in str(op1)
+
+        op0.apply(time_M=2)
+        op1.apply(time_M=2, u=u1)
+        assert np.allclose(u.data, u1.data, rtol=1e-6)
+
+    def test_custom_passes(self):
+        grid = Grid(shape=(12, 12, 21))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+
+        eqn = Eq(u.forward, u + 1e-4*u.laplace)
+        op = Operator(eqn, opt=('blocking', 'simd', {'intrinsics': 'avx512'}))
+        assert '_mm512_fmadd_ps' in str(op)
+
+        # Intrinsics lowering acts on the Iterations vectorized by the `simd` pass
+        with pytest.raises(InvalidOperator):
+            Operator(eqn, opt=('blocking', {'intrinsics': 'avx512'}))
+
+    def test_unsupported(self):
+        grid = Grid(shape=(12, 12, 12))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+
+        # Non-polynomial operations are left to the compiler's auto-vectorizer
+        eqn = Eq(u.forward, sin(u) + u.laplace)
+        op = Operator(eqn, opt=('advanced', {'intrinsics': 'avx512'}))
+
+        z = grid.dimensions[-1]
+        iterations = [i for i in FindNodes(Iteration).visit(op._func_table['bf0'])
+                      if i.dim is z]
+        assert len(iterations) == 1
+        assert '_mm512' not in str(op)
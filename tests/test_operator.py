@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from itertools import permutations
+from unittest.mock import patch
 
 from conftest import skipif
 from devito import (Grid, Eq, Operator, Constant, Function, TimeFunction,
@@ -8,6 +9,7 @@ from devito import (Grid, Eq, Operator, Constant, Function, TimeFunction,
                     NODE, CELL, dimensions, configuration, TensorFunction,
                     TensorTimeFunction, VectorFunction, VectorTimeFunction, switchconfig)
 from devito import  Le, Lt, Ge, Gt  # noqa
+from devito.compiler import _jit_compiled
 from devito.exceptions import InvalidOperator
 from devito.finite_differences.differentiable import diff2sympy
 from devito.ir.equations import ClusterizedEq
@@ -138,6 +140,46 @@ class TestCodeGen(object):
         assert op.parameters[4].is_Scalar
         assert 'a_dense[x + 1] = 2.0F*constant + a_dense[x + 1]' in str(op)
 
+    def test_parameters_no_profiling(self):
+        """Tests that ``profile=False`` drops the C-level timers."""
+        grid = Grid(shape=(3,))
+        a_dense = Function(name='a_dense', grid=grid)
+        eqn = Eq(a_dense, a_dense + 2.)
+
+        op = Operator(eqn, openmp=False, profile=False)
+        assert 'timers' not in [i.name for i in op.parameters]
+        assert 'gettimeofday' not in str(op)
+
+        summary = op.apply()
+        assert len(summary) == 0
+        assert np.all(a_dense.data == 2.)
+
+    @pytest.mark.skipif(not configuration['compiler'].supports_float16,
+                        reason="Compiler lacks `_Float16` support")
+    def test_mixed_precision(self):
+        """Tests code generation for Functions with heterogeneous dtypes."""
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid, dtype=np.float16)
+        v = TimeFunction(name='v', grid=grid, dtype=np.float64)
+        m = Function(name='m', grid=grid)
+        m.data[:] = 0.5
+        u.data[:] = 1.
+
+        op = Operator([Eq(u.forward, m*u + 1.), Eq(v.forward, v + m)], opt='noop')
+
+        # Half precision is a storage-only format; the arithmetic is carried
+        # out in single precision
+        assert '_Float16 (*restrict u)' in str(op)
+        assert 'm[x + 1][y + 1]*(float)u[' in str(op)
+
+        op.apply(time_M=1)
+        assert np.all(u.data[0] == 1.75)
+        assert np.all(v.data[0] == 1.)
+
+    def test_half_precision_scalar(self):
+        with pytest.raises(TypeError):
+            Constant(name='c', dtype=np.float16)
+
     @pytest.mark.parametrize('expr, so, to, expected', [
         ('Eq(u.forward,u+1)', 0, 1, 'Eq(u[t+1,x,y,z],u[t,x,y,z]+1)'),
         ('Eq(u.forward,u+1)', 1, 1, 'Eq(u[t+1,x+1,y+1,z+1],u[t,x+1,y+1,z+1]+1)'),
@@ -258,6 +300,32 @@ class TestCodeGen(object):
         assert np.all(u0.data[:2, :2] == 1) and np.all(u0.data[1:3, 1:3] == 1)
         assert np.all(u0.data[2:3, 3] == 2) and np.all(u0.data[3, 2:3] == 2)
 
+    def test_soname_compiler_flags(self):
+        """
+        Test that Operators generating the same code share the same soname,
+        unless they are compiled with different flags.
+        """
+        grid = Grid(shape=(3, 3))
+
+        u = TimeFunction(name='u', grid=grid)
+
+        op0 = Operator(Eq(u.forward, u + 1))
+        op1 = Operator(Eq(u.forward, u + 1))
+        assert op0._soname == op1._soname
+
+        op2 = Operator(Eq(u.forward, u + 1))
+        op2._compiler = op2._compiler.__new_from__()
+        op2._compiler.cflags += ['-DDEVITO_TEST']
+        assert op2._soname != op0._soname
+
+        # Already jit-compiled within this process -> no codepy lookup
+        op0.cfunction
+        assert op0._soname in _jit_compiled
+        with patch('devito.compiler.compile_from_string') as compile_from_string:
+            recompiled, _ = op1._compiler.jit_compile(op1._soname, str(op1.ccode))
+        assert not recompiled
+        assert not compile_from_string.called
+
 
 class TestArithmetic(object):
 
@@ -1140,6 +1208,34 @@ class TestApplyArguments(object):
         assert (op.arguments(u=u2, time_M=0)['nb'] is
                 grid2.distributor._obj_neighborhood.value)
 
+    def test_dataobj_reuse(self):
+        """
+        Test that the ctypes dataobj of a Function is only rebuilt when
+        the underlying buffer changes.
+        """
+        grid = Grid(shape=(4, 4))
+
+        f = Function(name='f', grid=grid)
+        f1 = Function(name='f', grid=grid)
+
+        op = Operator(Eq(f, f + 1))
+
+        dataobj = op.arguments()['f']
+        assert op.arguments()['f'] is dataobj
+        assert op.arguments(f=f1)['f'] is not dataobj
+
+        # Objects for user-provided arrays aren't cached, as that would keep
+        # the arrays alive
+        array = np.zeros(f.shape_allocated, dtype=f.dtype)
+        assert op.arguments(f=array)['f'] is not dataobj
+        assert f._C_dataobj[1] is dataobj
+        assert op.arguments()['f'] is dataobj
+
+        op.apply()
+        op.apply()
+        assert np.all(f.data == 2.)
+        assert np.all(f1.data == 0.)
+
 
 @skipif('device')
 class TestDeclarator(object):
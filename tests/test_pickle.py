@@ -6,7 +6,8 @@ import pickle
 from conftest import skipif
 from devito import (Constant, Eq, Function, TimeFunction, SparseFunction, Grid,
                     Dimension, SubDimension, ConditionalDimension, IncrDimension,
-                    TimeDimension, SteppingDimension, Operator, ShiftedDimension)
+                    TimeDimension, SteppingDimension, Operator, ShiftedDimension,
+                    switchconfig)
 from devito.data import LEFT, OWNED
 from devito.mpi.halo_scheme import Halo
 from devito.mpi.routines import (MPIStatusObject, MPIMsgEnriched, MPIRequestObject,
@@ -370,6 +371,24 @@ def test_operator_timefunction_w_preallocation():
     assert np.all(f.data[2] == 2)
 
 
+@switchconfig(profiling='advanced')
+def test_operator_advanced_profiling():
+    grid = Grid(shape=(3, 3, 3))
+    f = TimeFunction(name='f', grid=grid)
+
+    op = Operator(Eq(f.forward, f.dx + f.dy), opt='noop')
+    summary = op.apply(time_M=1)
+    entry = summary[('section0', None)]
+    assert entry.itershapes == ((2, 3, 3, 3),)
+
+    pkl_op = pickle.dumps(op)
+    new_op = pickle.loads(pkl_op)
+
+    summary = new_op.apply(time_M=1, f=f)
+    assert summary[('section0', None)].ops == entry.ops
+    assert summary[('section0', None)].itershapes == entry.itershapes
+
+
 @skipif(['nompi'])
 @pytest.mark.parallel(mode=[1])
 def test_mpi_objects():
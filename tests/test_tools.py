@@ -3,7 +3,7 @@ import pytest
 from sympy.abc import a, b, c, d, e
 import time
 
-from devito.tools import toposort, filter_ordered
+from devito.tools import ReducerMap, toposort, filter_ordered
 
 
 @pytest.mark.parametrize('elements, expected', [
@@ -32,3 +32,24 @@ def test_sorting():
     # This one is slightly faster
     assert t2 - t1 < .5 * (t1 - t0)
     assert sort_key == sort_nokey
+
+
+def test_filter_ordered_symbolic():
+    # SymPy objects can't be sorted by numpy, which triggers the fallback
+    assert filter_ordered([c, a, b, a, e, c]) == [c, a, b, e]
+
+
+def test_reducer_map():
+    args = ReducerMap()
+    args.update({'x_M': 3, 'u': np.zeros(3)})
+    args.update({'x_M': 3, 'y_M': 4})
+    args.update({'x_M': 3, 'u': np.zeros(3)})
+
+    reduced = args.reduce_all()
+    assert list(reduced) == ['x_M', 'u', 'y_M']
+    assert reduced['x_M'] == 3
+    assert reduced['y_M'] == 4
+
+    args.update({'y_M': 5})
+    with pytest.raises(ValueError):
+        args.reduce_all()
@@ -3,7 +3,7 @@ from sympy import Mod, Eq
 import pytest
 
 from devito.ir.equations import DummyEq
-from devito.ir.iet import (Block, Expression, Callable, FindSections,
+from devito.ir.iet import (Block, Expression, Callable, FindNodes, FindSections,
                            FindSymbols, IsPerfectIteration, Transformer,
                            Conditional, printAST, Iteration)
 from devito.types import SpaceDimension, Array, Grid
@@ -206,6 +206,20 @@ def test_find_sections(exprs, block1, block2, block3):
     assert len(found[2]) == 1
 
 
+def test_find_symbols_multimode(block1, block2, block3, block4):
+    modes = ('symbolics', 'free-symbols', 'indexeds', 'defines')
+
+    for block in [block1, block2, block3, block4]:
+        found = FindSymbols(modes).visit(block)
+        assert len(found) == len(modes)
+        for mode, symbols in zip(modes, found):
+            assert symbols == FindSymbols(mode).visit(block)
+
+    functions, defines = FindSymbols(('symbolics', 'defines')).visit(block1)
+    assert [f.name for f in functions] == ['a', 'b', 'i_size']
+    assert [d.name for d in defines] == ['i', 'j', 'k']
+
+
 def test_is_perfect_iteration(block1, block2, block3, block4):
     checker = IsPerfectIteration()
 
@@ -332,3 +346,13 @@ def test_nested_transformer(exprs, iters, block2):
   <Iteration s::s::(0, 4, 1)>
     <Iteration k::k::(0, 7, 1)>
       <Expression a[i] = 8.0*a[i] + 6.0/b[i]>"""
+
+
+def test_transformer_reuse_leaves(exprs, block3):
+    """Untouched Expressions must be reused, not rebuilt."""
+    line = '// Replaced expression'
+    processed = Transformer({exprs[0]: Block(c.Line(line))}).visit(block3)
+
+    found = FindNodes(Expression).visit(processed)
+    assert len(found) == 3
+    assert all(i is j for i, j in zip(found, exprs[1:]))